@@ -1,14 +1,87 @@
 """Pipeline API endpoints."""  
 import os  
-import tempfile  
-from typing import List  
+import asyncio
+import hashlib
+import json
+from contextlib import asynccontextmanager
+from typing import Dict, List, Tuple  
+from urllib.parse import quote
+import aiofiles
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException  
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from ..services.cache_service import CacheManager
 from ..services.orchestration_service import OrchestrationService  
+from ..services.pipeline_queue import PipelineQueue, QueueFullError
+from ..services.temp_file_pool import TempFilePool
 from ..config.settings import settings  
   
 router = APIRouter()  
 orchestration_service = OrchestrationService()  
+# Separate queues so long mining runs cannot starve graph generation
+graph_queue = PipelineQueue(
+    concurrency=settings.graph_worker_concurrency,
+    max_size=settings.graph_max_queue
+)
+mining_queue = PipelineQueue(
+    concurrency=settings.mining_worker_concurrency,
+    max_size=settings.mining_max_queue
+)
+result_cache = CacheManager(
+    redis_url=settings.redis_url,
+    default_ttl=settings.result_cache_ttl,
+    max_entries=settings.result_cache_max_entries
+)
+upload_pool = TempFilePool(settings.csv_cache_dir, settings.upload_pool_size)
+
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+@asynccontextmanager
+async def lifespan(app):
+    """Run the pipeline workers and release shared resources on shutdown."""
+    upload_pool.open()
+    graph_queue.start()
+    mining_queue.start()
+    yield
+    await graph_queue.stop()
+    await mining_queue.stop()
+    await orchestration_service.aclose()
+    await result_cache.aclose()
+    upload_pool.close()
+
+async def _enqueue(queue: PipelineQueue, func, **kwargs):
+    """Run a pipeline step through one of the bounded worker queues."""
+    try:
+        return await queue.submit(func, **kwargs)
+    except QueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+async def _save_upload(file: UploadFile) -> Tuple[str, str]:
+    """Stream an upload into a pooled scratch file, hashing it in the same pass.
+
+    Returns the scratch file path and the SHA-256 hex digest of its contents.
+    The caller must hand the path back with `upload_pool.release`.
+    """
+    file_path = upload_pool.acquire()
+    digest = hashlib.sha256()
+    try:
+        async with aiofiles.open(file_path, "wb") as out:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+                await out.write(chunk)
+    except BaseException:
+        upload_pool.release(file_path)
+        raise
+    return file_path, digest.hexdigest()
+
+def _release_uploads(file_paths: List[str]) -> None:
+    """Hand saved uploads back to the scratch file pool."""
+    for file_path in file_paths:
+        upload_pool.release(file_path)
+
+def _cache_key(prefix: str, *parts: str) -> str:
+    """Build a cache key from the SHA-256 of the given parts."""
+    digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+    return f"{prefix}:{digest}"
   
 @router.post("/generate-graph")  
 async def generate_graph(  
@@ -24,33 +97,51 @@ async def generate_graph(
         if not file.filename.endswith('.csv'):  
             raise HTTPException(status_code=400, detail="Only CSV files are allowed")  
       
-    # Save uploaded files to temporary directory  
-    temp_dir = tempfile.mkdtemp()  
-    csv_file_paths = []  
+    # Save uploaded files to pooled scratch files concurrently  
+    saved_paths: Dict[int, str] = {}
+    
+    async def save(index: int, file: UploadFile) -> str:
+        file_path, digest = await _save_upload(file)
+        # Record the path right away so the finally block releases it even if
+        # this handler is cancelled while other uploads are still being saved
+        saved_paths[index] = file_path
+        return digest
       
     try:  
-        for file in files:  
-            file_path = os.path.join(temp_dir, file.filename)  
-            with open(file_path, "wb") as f:  
-                content = await file.read()  
-                f.write(content)  
-            csv_file_paths.append(file_path)  
+        outcomes = await asyncio.gather(
+            *(save(index, file) for index, file in enumerate(files)), return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        csv_file_paths = [saved_paths[index] for index in range(len(files))]
+        file_digests = [f"{file.filename}={digest}" for file, digest in zip(files, outcomes)]
+        
+        # Jobs built from identical CSVs and config can share mining results
+        graph_key = _cache_key(
+            "graph", *sorted(file_digests), config, schema_json, writer_type, graph_type
+        )
           
-        result = await orchestration_service.generate_networkx(
+        result = await _enqueue(
+            graph_queue,
+            orchestration_service.generate_networkx,
             csv_files=csv_file_paths,
+            filenames=[file.filename for file in files],
             config=config,
             schema_json=schema_json,
             writer_type=writer_type,
             graph_type=graph_type,
             tenant_id="default"
         )
+        
+        if result.get("status") == "success":
+            await result_cache.set(f"graph:{result['job_id']}", graph_key)
           
         return result
           
     finally:  
-        import shutil  
-        if os.path.exists(temp_dir):  
-            shutil.rmtree(temp_dir)
+        # Truncating or unlinking large scratch files is blocking disk I/O
+        await asyncio.to_thread(_release_uploads, list(saved_paths.values()))
 
 @router.post("/mine-patterns")
 async def mine_patterns(
@@ -85,11 +176,31 @@ async def mine_patterns(
         'graph_output_format': graph_output_format
     }
     
-    result = await orchestration_service.mine_patterns(
+    # Mining is keyed by the job's source CSVs and the mining config, so a job
+    # built from the same inputs gets its own copy of earlier results
+    graph_key = await result_cache.get(f"graph:{job_id}")
+    cache_key = None
+    if graph_key is not None:
+        cache_key = _cache_key("mine", graph_key, json.dumps(mining_config, sort_keys=True))
+        cached = await result_cache.get(cache_key)
+        if cached is not None:
+            result = await orchestration_service.reuse_mining_output(
+                cached["job_id"], job_id, cache_key
+            )
+            if result is not None:
+                return result
+    
+    result = await _enqueue(
+        mining_queue,
+        orchestration_service.mine_patterns,
         job_id=job_id,
-        mining_config=mining_config
+        mining_config=mining_config,
+        result_key=cache_key
     )
     
+    if cache_key is not None and result.get("status") == "success":
+        await result_cache.set(cache_key, {"job_id": job_id})
+    
     return result
 
 @router.get("/download-result")
@@ -105,11 +216,10 @@ async def download_result(job_id: str, filename: str = None):
             )
         else:
             # Download entire job as ZIP
-            zip_path = orchestration_service.create_job_archive(job_id)
-            return FileResponse(
-                path=zip_path,
-                filename=f"{job_id}.zip",
-                media_type='application/zip'
+            return StreamingResponse(
+                orchestration_service.create_job_archive_stream(job_id),
+                media_type='application/zip',
+                headers={'Content-Disposition': f'attachment; filename="{quote(job_id)}.zip"'}
             )
             
     except PermissionError as e:
@@ -135,7 +245,6 @@ async def get_mining_status(job_id: str):
                 "message": "Waiting for miner to start..."
             }
             
-        import json
         with open(progress_path, 'r') as f:
             status_data = json.load(f)
             
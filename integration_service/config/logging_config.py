@@ -0,0 +1,30 @@
+"""Logging setup for Integration Service."""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+def setup_logging(level: str = "INFO") -> QueueListener:
+    """Route root logging through a queue so request handlers never block on log I/O.
+
+    Records are handed to a background QueueListener thread, which does the
+    actual stream writes.
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.setLevel(level.upper())
+    root.addHandler(QueueHandler(log_queue))
+
+    # httpx logs every request at INFO; keep per-request lines out of the hot path
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
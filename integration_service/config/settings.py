@@ -1,25 +1,73 @@
-"""Configuration management for Integration Service."""  
-import os  
-from dotenv import load_dotenv  
-  
-load_dotenv()  
-  
-class Settings:  
-    """Integration Service settings"""  
-      
-    def __init__(self):  
-        # Service URLs  
-        self.atomspace_url = os.getenv('ATOMSPACE_API_URL', 'http://atomspace-api-dev:8000') 
-        self.miner_url = os.getenv('NEURAL_MINER_URL', 'http://neural-miner:5000')  
-          
-        # Timeouts 
-        self.atomspace_timeout = int(os.getenv('ATOMSPACE_TIMEOUT', '600'))  
-        self.miner_timeout = int(os.getenv('MINER_TIMEOUT', '1800'))  
-          
-        # CSV caching  
-        self.csv_cache_dir = os.getenv('CSV_CACHE_DIR', './cache')  
-          
-        # Shared volume  
-        self.shared_volume_path = os.getenv('SHARED_VOLUME_PATH', '/shared/output')  
-  
-settings = Settings()
\ No newline at end of file
+"""Configuration management for Integration Service."""
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from dotenv import load_dotenv
+
+load_dotenv()
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Integration Service settings"""
+
+    # Logging
+    log_level: str
+
+    # Service URLs
+    atomspace_url: str
+    miner_url: str
+
+    # Timeouts
+    atomspace_timeout: int
+    miner_timeout: int
+
+    # HTTP connection pool
+    http_max_connections: int
+    http_max_keepalive_connections: int
+    http_connect_retries: int
+
+    # Pipeline worker queues, one per endpoint
+    graph_worker_concurrency: int
+    graph_max_queue: int
+    mining_worker_concurrency: int
+    mining_max_queue: int
+
+    # Result cache (in-process unless REDIS_URL is set)
+    redis_url: str
+    result_cache_ttl: int
+    result_cache_max_entries: int
+
+    # CSV caching
+    csv_cache_dir: str
+    upload_pool_size: int
+
+    # Shared volume
+    shared_volume_path: str
+    miner_shared_handoff: bool
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read settings from the environment once per process."""
+    return Settings(
+        log_level=os.getenv('LOG_LEVEL', 'INFO'),
+        atomspace_url=os.getenv('ATOMSPACE_API_URL', 'http://atomspace-api-dev:8000'),
+        miner_url=os.getenv('NEURAL_MINER_URL', 'http://neural-miner:5000'),
+        atomspace_timeout=int(os.getenv('ATOMSPACE_TIMEOUT', '600')),
+        miner_timeout=int(os.getenv('MINER_TIMEOUT', '1800')),
+        http_max_connections=int(os.getenv('HTTP_MAX_CONNECTIONS', '64')),
+        http_max_keepalive_connections=int(os.getenv('HTTP_MAX_KEEPALIVE_CONNECTIONS', '32')),
+        http_connect_retries=int(os.getenv('HTTP_CONNECT_RETRIES', '3')),
+        graph_worker_concurrency=int(os.getenv('GRAPH_WORKER_CONCURRENCY', '4')),
+        graph_max_queue=int(os.getenv('GRAPH_MAX_QUEUE', '100')),
+        mining_worker_concurrency=int(os.getenv('MINING_WORKER_CONCURRENCY', '2')),
+        mining_max_queue=int(os.getenv('MINING_MAX_QUEUE', '50')),
+        redis_url=os.getenv('REDIS_URL', ''),
+        result_cache_ttl=int(os.getenv('RESULT_CACHE_TTL', '86400')),
+        result_cache_max_entries=int(os.getenv('RESULT_CACHE_MAX_ENTRIES', '1024')),
+        csv_cache_dir=os.getenv('CSV_CACHE_DIR', './cache'),
+        upload_pool_size=int(os.getenv('UPLOAD_POOL_SIZE', '32')),
+        shared_volume_path=os.getenv('SHARED_VOLUME_PATH', '/shared/output'),
+        miner_shared_handoff=os.getenv('MINER_SHARED_HANDOFF', 'false').lower() in ('1', 'true', 'yes')
+    )
+
+settings = get_settings()
@@ -1,13 +1,19 @@
 """FastAPI application for Integration Service."""  
 from fastapi import FastAPI  
 from fastapi.middleware.cors import CORSMiddleware  
-from .api.pipeline import router  
+from fastapi.responses import ORJSONResponse
+from .api.pipeline import router, lifespan  
 from .config.settings import settings  
+from .config.logging_config import setup_logging
+  
+setup_logging(settings.log_level)
   
 app = FastAPI(  
     title="NeuroGraph Integration Service",  
     description="Orchestration service for Neural Subgraph Mining pipeline",  
-    version="1.0.0"  
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )  
   
 # CORS middleware  
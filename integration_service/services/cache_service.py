@@ -0,0 +1,67 @@
+"""Result cache for expensive pipeline steps."""
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
+
+class CacheManager:
+    """JSON result cache backed by Redis, falling back to an in-process LRU.
+
+    Redis is only used when ``redis_url`` is set; if it is unreachable the
+    in-memory cache keeps serving so a cache outage never fails a request.
+    """
+
+    def __init__(
+        self,
+        redis_url: str = None,
+        default_ttl: int = 86400,
+        max_entries: int = 1024,
+        timeout: float = 1.0
+    ):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        # Short socket timeouts so an unresponsive Redis falls back instead of hanging
+        self._redis = redis.from_url(
+            redis_url, socket_connect_timeout=timeout, socket_timeout=timeout
+        ) if redis_url else None
+
+    async def get(self, key: str) -> Optional[Any]:
+        if self._redis is not None:
+            try:
+                raw = await self._redis.get(key)
+                if raw is not None:
+                    return json.loads(raw)
+            except RedisError:
+                pass
+
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int = None) -> None:
+        ttl = ttl or self.default_ttl
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, json.dumps(value), ex=ttl)
+            except RedisError:
+                pass
+
+        self._memory[key] = (time.monotonic() + ttl, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    async def aclose(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
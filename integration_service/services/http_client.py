@@ -0,0 +1,19 @@
+"""Shared construction of outbound HTTP clients."""
+import httpx
+
+from ..config.settings import settings
+
+
+def build_http_client(timeout: float) -> httpx.AsyncClient:
+    """Return an AsyncClient using the configured connection pool and connect retries."""
+    # Transport retries only cover failed connects, so they are safe for non-idempotent POSTs
+    return httpx.AsyncClient(
+        timeout=timeout,
+        transport=httpx.AsyncHTTPTransport(
+            retries=settings.http_connect_retries,
+            limits=httpx.Limits(
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+                max_connections=settings.http_max_connections
+            )
+        )
+    )
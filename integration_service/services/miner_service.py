@@ -1,9 +1,41 @@
 """Neural Miner communication service."""  
 import httpx  
+import msgspec
 import os  
 import asyncio  
+import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from typing import Dict, Any  
+from .multipart import MultipartFileStream
+from .http_client import build_http_client
 from ..config.settings import settings  
+
+# Responses that mean "try again later" rather than a failed mining job
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+MAX_RETRY_DELAY = 60
+
+def _retry_delay(attempt: int, response: httpx.Response = None) -> float:
+    """Seconds to wait before the next attempt, honouring Retry-After when present."""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+                return min(max(delay, 0.0), MAX_RETRY_DELAY)
+            except (TypeError, ValueError):
+                pass
+    # Exponential backoff with jitter
+    return min(2 ** attempt + random.uniform(0, 1), MAX_RETRY_DELAY)
+  
+class MotifOutput(msgspec.Struct):
+    """Fields the miner must return; any other keys in its response are passed through."""
+    results_path: Any
+    plots_path: Any
+    status: Any
   
 class MinerService:  
     """Service for communicating with Neural Subgraph Miner."""  
@@ -11,6 +43,8 @@ class MinerService:
     def __init__(self):  
         self.miner_url = settings.miner_url  
         self.timeout = settings.miner_timeout  
+        self.shared_handoff = settings.miner_shared_handoff
+        self.client = build_http_client(self.timeout)
       
     async def mine_motifs(
         self, 
@@ -19,7 +53,11 @@ class MinerService:
         mining_config: Dict[str, Any] = None,
         max_retries: int = 3
     ) -> Dict[str, Any]:  
-        """Send NetworkX file to miner with config and return discovered motifs."""  
+        """Send NetworkX file to miner with config and return discovered motifs.
+        
+        Returns the miner's full JSON response, after checking that it has the
+        fields required by `MotifOutput`.
+        """  
         if not os.path.exists(networkx_file_path):  
             raise FileNotFoundError(f"NetworkX file not found: {networkx_file_path}")  
           
@@ -33,10 +71,6 @@ class MinerService:
     
         for attempt in range(max_retries):  
             try:  
-                # Read NetworkX file  
-                with open(networkx_file_path, 'rb') as f:  
-                    networkx_data = f.read()  
-                  
                 data = {}
                 if job_id:
                     data['job_id'] = job_id
@@ -53,33 +87,43 @@ class MinerService:
                 data['sample_method'] = mining_config.get('sample_method', 'tree')
                 data['visualize_instances'] = mining_config.get('visualize_instances', False)
                 
-                # Send to miner using HTTP client  
-                async with httpx.AsyncClient(timeout=self.timeout) as client:  
-                    files = {'graph_file': ('graph.gpickle', networkx_data, 'application/octet-stream')}
-                    
-                    response = await client.post(f"{self.miner_url}/mine", files=files, data=data)  
-                      
-                    if response.status_code != 200:  
-                        raise RuntimeError(f"Miner returned {response.status_code}: {response.text}")  
-                      
-                    result = response.json()  
+                if self.shared_handoff:
+                    # Miner reads the graph straight from the shared volume
+                    response = await self.client.post(
+                        f"{self.miner_url}/mine",
+                        json={**data, 'networkx_path': networkx_file_path}
+                    )
+                else:
+                    # Stream the NetworkX file to the miner using the shared HTTP client  
+                    files = [('graph_file', 'graph.gpickle', networkx_file_path, 'application/octet-stream')]
+                    body = MultipartFileStream(data, files)
+                    response = await self.client.post(
+                        f"{self.miner_url}/mine",
+                        content=body,
+                        headers=body.headers
+                    )  
+              
+                if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries - 1:
+                    await asyncio.sleep(_retry_delay(attempt, response))
+                    continue
+                
+                if response.status_code != 200:  
+                    raise RuntimeError(f"Miner returned {response.status_code}: {response.text}")  
                   
-                # Validate response structure  
-                if not self.validate_motif_output(result):  
-                    raise ValueError("Invalid motif output structure from miner")  
+                # Required fields are checked against MotifOutput in C, without walking the payload in Python  
+                try:
+                    result = msgspec.json.decode(response.content)
+                    msgspec.convert(result, type=MotifOutput)
+                except msgspec.DecodeError as e:
+                    raise ValueError(f"Invalid motif output structure from miner: {e}") from e
                       
                 return result  
                   
             except (httpx.RequestError, httpx.ConnectError, httpx.ConnectTimeout) as e:  
                 if attempt == max_retries - 1:  
                     raise Exception(f"Miner request failed after {max_retries} attempts: {str(e)}")  
-                wait_time = 2 ** attempt  # Exponential backoff  
-                await asyncio.sleep(wait_time)  
+                await asyncio.sleep(_retry_delay(attempt))  
       
-    def validate_motif_output(self, output: Dict[str, Any]) -> bool:  
-        """Validate miner output structure."""  
-        required_keys = ['results_path', 'plots_path', 'status']  
-        if not all(key in output for key in required_keys):  
-            return False  
-
-        return True
\ No newline at end of file
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        await self.client.aclose()
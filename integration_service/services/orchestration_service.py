@@ -1,13 +1,22 @@
 """Main orchestration service for pipeline coordination."""  
+import io
 import os  
 import uuid  
-import httpx  
-import tempfile  
+import asyncio
+import orjson
 import shutil
 import json
-from typing import Dict, Any, List  
+import logging
+import zipfile
+from typing import Dict, Any, Iterator, List, Optional  
 from .miner_service import MinerService  
+from .multipart import MultipartFileStream
+from .http_client import build_http_client
 from ..config.settings import settings  
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_CHUNK_SIZE = 1 << 20
   
 class OrchestrationService:  
     """Main pipeline orchestrator."""  
@@ -17,6 +26,7 @@ class OrchestrationService:
         self.atomspace_url = settings.atomspace_url  
         self.timeout = settings.atomspace_timeout  
         self.local_output_dir = "/app/output"
+        self.client = build_http_client(self.timeout)
     
     async def generate_networkx(
         self,
@@ -25,69 +35,69 @@ class OrchestrationService:
         schema_json: str,
         writer_type: str,
         graph_type: str = "directed",
-        tenant_id: str = "default"
+        tenant_id: str = "default",
+        filenames: List[str] = None
     ) -> Dict[str, Any]:
-        """Generate NetworkX graph from CSV files."""
+        """Generate NetworkX graph from CSV files.
+        
+        `filenames` are the upload names sent to AtomSpace, defaulting to each path's basename.
+        """
         try:
             job_id = str(uuid.uuid4())
             
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as config_file:  
-                config_file.write(config)  
-                config_path = config_file.name  
+            data = {  
+                'config': config,  
+                'schema_json': schema_json,  
+                'writer_type': writer_type,  
+                'graph_type': graph_type,
+                'tenant_id': tenant_id  
+            }  
+            if filenames is None:
+                filenames = [os.path.basename(csv_file_path) for csv_file_path in csv_files]
+            files = [
+                ('files', filename, csv_file_path, 'text/csv')
+                for filename, csv_file_path in zip(filenames, csv_files)
+            ]
+            body = MultipartFileStream(data, files)
                 
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as schema_file:  
-                schema_file.write(schema_json)  
-                schema_path = schema_file.name  
+            response = await self.client.post(  
+                f"{self.atomspace_url}/api/load",  
+                content=body,
+                headers=body.headers
+            )  
                 
-            try:  
-                async with httpx.AsyncClient(timeout=self.timeout) as client:  
-                    files = []  
-                    for csv_file_path in csv_files:  
-                        csv_file = open(csv_file_path, 'rb')  
-                        files.append(('files', (os.path.basename(csv_file_path), csv_file, 'text/csv')))  
-                    
-                    data = {  
-                        'config': config,  
-                        'schema_json': schema_json,  
-                        'writer_type': writer_type,  
-                        'graph_type': graph_type,
-                        'tenant_id': tenant_id  
-                    }  
-                        
-                    response = await client.post(  
-                        f"{self.atomspace_url}/api/load",  
-                        files=files,  
-                        data=data  
-                    )  
-                        
-                    for _, (_, file_obj, _) in files:  
-                        file_obj.close()  
-                        
-                    if response.status_code != 200:  
-                        raise RuntimeError(f"AtomSpace returned {response.status_code}: {response.text}")  
-                        
-                    result = response.json()  
-                    
-                networkx_file = f"/shared/output/{result['job_id']}/networkx_graph.pkl"  
-                    
-                return {
-                    "job_id": result['job_id'],
-                    "status": "success",
-                    "networkx_file": networkx_file
-                }
-                    
-            finally:  
-                os.unlink(config_path)  
-                os.unlink(schema_path)
+            if response.status_code != 200:  
+                raise RuntimeError(f"AtomSpace returned {response.status_code}: {response.text}")  
+                
+            result = orjson.loads(response.content)  
+                
+            networkx_file = f"/shared/output/{result['job_id']}/networkx_graph.pkl"  
+                
+            return {
+                "job_id": result['job_id'],
+                "status": "success",
+                "networkx_file": networkx_file
+            }
                 
         except Exception as e:
             return {"status": "error", "error": str(e)}
     
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients."""
+        await self.client.aclose()
+        await self.miner_service.aclose()
+
     async def mine_patterns(
         self,
         job_id: str,
-        mining_config: Dict[str, Any]
+        mining_config: Dict[str, Any],
+        result_key: str = None
     ) -> Dict[str, Any]:
+        """Mine the job's graph and copy the results to the local output directory.
+
+        `result_key` identifies this graph and config; it is recorded with the
+        local copy so `reuse_mining_output` can hand the results to another job.
+        """
         try:
             # Verify NetworkX file exists
             networkx_file = f"/shared/output/{job_id}/networkx_graph.pkl"
@@ -106,21 +116,42 @@ class OrchestrationService:
                 mining_config=miner_config
             )
             
-            local_paths = self._copy_to_local_output(job_id)
+            local_paths = await asyncio.to_thread(self._copy_to_local_output, job_id, result_key)
             
-            download_url = f"http://localhost:9000/api/download-result?job_id={job_id}"
-            
-            return {
-                "job_id": job_id,
-                "status": "success",
-                "output_paths": local_paths,
-                "download_url": download_url
-            }
+            return self._mining_result(job_id, local_paths)
         except Exception as e:
             return {"status": "error", "error": str(e)}
     
+    async def reuse_mining_output(
+        self,
+        source_job_id: str,
+        job_id: str,
+        result_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """Copy another job's mining results into `job_id` without re-mining.
+
+        Returns None if the source job no longer holds the results for `result_key`.
+        """
+        local_paths = await asyncio.to_thread(
+            self._copy_local_output, source_job_id, job_id, result_key
+        )
+        if local_paths is None:
+            return None
+        return self._mining_result(job_id, local_paths)
+    
+    def _mining_result(self, job_id: str, local_paths: Dict[str, str]) -> Dict[str, Any]:
+        return {
+            "job_id": job_id,
+            "status": "success",
+            "output_paths": local_paths,
+            "download_url": f"http://localhost:9000/api/download-result?job_id={job_id}"
+        }
+    
     async def get_graph_type_from_metadata(self, job_id: str) -> str:
         """Read graph_type from networkx_metadata.json"""
+        return await asyncio.to_thread(self._read_graph_type, job_id)
+    
+    def _read_graph_type(self, job_id: str) -> str:
         metadata_path = f"/shared/output/{job_id}/networkx_metadata.json"
         
         if not os.path.exists(metadata_path):
@@ -137,7 +168,7 @@ class OrchestrationService:
                 metadata = json.load(f)
             
             graph_type = metadata.get('graph_type', 'directed')
-            print(f"Auto-detected graph_type='{graph_type}' from metadata for job_id={job_id}")
+            logger.debug("Auto-detected graph_type=%r from metadata for job_id=%s", graph_type, job_id)
             return graph_type
             
         except json.JSONDecodeError as e:
@@ -145,32 +176,69 @@ class OrchestrationService:
         except Exception as e:
             raise RuntimeError(f"Error reading metadata for job_id: {job_id}: {str(e)}")
     
-    def _copy_to_local_output(self, job_id: str) -> Dict[str, str]:
+    def _copy_to_local_output(self, job_id: str, result_key: str = None) -> Dict[str, str]:
         """Copy results from shared volume to local directory and return paths."""
         shared_job_dir = f"/shared/output/{job_id}"
         local_job_dir = f"{self.local_output_dir}/{job_id}"
         
         os.makedirs(local_job_dir, exist_ok=True)
+        self._write_result_key(job_id, None)
+        
+        for name in ("results", "plots"):
+            _replace_tree(f"{shared_job_dir}/{name}", f"{local_job_dir}/{name}")
+        
+        self._write_result_key(job_id, result_key)
+        return self._local_paths(job_id)
+
+    def _copy_local_output(self, source_job_id: str, job_id: str, result_key: str) -> Optional[Dict[str, str]]:
+        """Copy a job's local results to another job if they still match `result_key`."""
+        if self._read_result_key(source_job_id) != result_key:
+            return None
+        if source_job_id == job_id:
+            return self._local_paths(job_id)
+        
+        source_job_dir = f"{self.local_output_dir}/{source_job_id}"
+        local_job_dir = f"{self.local_output_dir}/{job_id}"
+        
+        os.makedirs(local_job_dir, exist_ok=True)
+        self._write_result_key(job_id, None)
         
-        shared_results = f"{shared_job_dir}/results"
-        local_results = f"{local_job_dir}/results"
-        if os.path.exists(shared_results):
-            if os.path.exists(local_results):
-                shutil.rmtree(local_results)
-            shutil.copytree(shared_results, local_results)
+        for name in ("results", "plots"):
+            _replace_tree(f"{source_job_dir}/{name}", f"{local_job_dir}/{name}")
         
-        shared_plots = f"{shared_job_dir}/plots"
-        local_plots = f"{local_job_dir}/plots"
-        if os.path.exists(shared_plots):
-            if os.path.exists(local_plots):
-                shutil.rmtree(local_plots)
-            shutil.copytree(shared_plots, local_plots)
+        # The source may have been re-mined with another config while we copied
+        if self._read_result_key(source_job_id) != result_key:
+            return None
         
+        self._write_result_key(job_id, result_key)
+        return self._local_paths(job_id)
+
+    def _local_paths(self, job_id: str) -> Dict[str, str]:
         return {
             "results": f"./integration_service/output/{job_id}/results",
             "plots": f"./integration_service/output/{job_id}/plots"
         }
 
+    def _result_key_path(self, job_id: str) -> str:
+        # Kept beside the job directory so it never ends up in the job's archive
+        return f"{self.local_output_dir}/{job_id}.result_key"
+
+    def _read_result_key(self, job_id: str) -> Optional[str]:
+        try:
+            with open(self._result_key_path(job_id), 'r') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _write_result_key(self, job_id: str, result_key: Optional[str]) -> None:
+        path = self._result_key_path(job_id)
+        if result_key is None:
+            if os.path.exists(path):
+                os.unlink(path)
+            return
+        with open(path, 'w') as f:
+            f.write(result_key)
+
     def get_result_file_path(self, job_id: str, filename: str) -> str:
     
         job_dir = os.path.abspath(os.path.join(self.local_output_dir, job_id))
@@ -184,17 +252,59 @@ class OrchestrationService:
             
         return file_path
 
-    def create_job_archive(self, job_id: str) -> str:
+    def create_job_archive_stream(self, job_id: str) -> Iterator[bytes]:
         """
-        Create a zip archive of the entire job directory.
+        Return an iterator that yields a zip archive of the entire job directory
+        as it is built, without writing the archive to disk.
         """
         job_dir = os.path.join(self.local_output_dir, job_id)
         if not os.path.exists(job_dir):
             raise FileNotFoundError(f"Job directory not found: {job_id}")
         
-        zip_base_name = os.path.join(self.local_output_dir, f"{job_id}")
-        zip_file_path = f"{zip_base_name}.zip"
-        
-        shutil.make_archive(zip_base_name, 'zip', job_dir)
-        
-        return zip_file_path
\ No newline at end of file
+        return self._iter_job_archive(job_dir)
+
+    def _iter_job_archive(self, job_dir: str) -> Iterator[bytes]:
+        buffer = _ArchiveBuffer()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for root, dirs, files in os.walk(job_dir):
+                dirs.sort()
+                for name in sorted(files):
+                    path = os.path.join(root, name)
+                    info = zipfile.ZipInfo.from_file(path, os.path.relpath(path, job_dir))
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with open(path, 'rb') as src, archive.open(info, 'w') as dest:
+                        while chunk := src.read(ARCHIVE_CHUNK_SIZE):
+                            dest.write(chunk)
+                            if data := buffer.drain():
+                                yield data
+                    if data := buffer.drain():
+                        yield data
+        # Closing the archive writes the central directory
+        yield buffer.drain()
+
+
+def _replace_tree(source: str, destination: str) -> None:
+    """Replace `destination` with a copy of `source`, if `source` exists."""
+    if os.path.exists(source):
+        if os.path.exists(destination):
+            shutil.rmtree(destination)
+        shutil.copytree(source, destination)
+
+
+class _ArchiveBuffer(io.RawIOBase):
+    """Write-only sink that collects zip output until the next drain()."""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
@@ -0,0 +1,98 @@
+"""Bounded job queue that caps concurrent pipeline work."""
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the pipeline queue cannot accept another job."""
+
+
+class _Job:
+    __slots__ = ("func", "args", "kwargs", "future", "task")
+
+    def __init__(self, func, args, kwargs, future):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = future
+        self.task: Optional[asyncio.Task] = None
+
+
+class PipelineQueue:
+    """Fixed pool of workers draining a bounded queue of pipeline jobs.
+
+    Callers ``submit`` a coroutine function and wait for its result; at most
+    ``concurrency`` jobs run at once and at most ``max_size`` wait behind them.
+    A caller that is cancelled also cancels its job, and only returns once the
+    job has stopped, so it can safely clean up whatever the job was using.
+    """
+
+    def __init__(self, concurrency: int, max_size: int):
+        self.concurrency = concurrency
+        self.max_size = max_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """Create the queue and spawn the workers on the running loop."""
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers and any jobs still waiting in the queue."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        while self._queue is not None and not self._queue.empty():
+            self._queue.get_nowait().future.cancel()
+        self._queue = None
+
+    async def submit(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Enqueue ``func(*args, **kwargs)`` and wait for its result."""
+        if self._queue is None:
+            raise RuntimeError("Pipeline queue is not running")
+
+        job = _Job(func, args, kwargs, asyncio.get_running_loop().create_future())
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError("Pipeline queue is full, retry later")
+
+        try:
+            return await job.future
+        except asyncio.CancelledError:
+            job.future.cancel()
+            if job.task is not None:
+                job.task.cancel()
+                await asyncio.wait({job.task})
+            raise
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                # The caller may have disconnected while the job was queued
+                if job.future.done():
+                    continue
+                job.task = asyncio.create_task(job.func(*job.args, **job.kwargs))
+                try:
+                    await asyncio.wait({job.task})
+                except asyncio.CancelledError:
+                    job.task.cancel()
+                    job.future.cancel()
+                    raise
+
+                if job.future.done():
+                    continue
+                if job.task.cancelled():
+                    job.future.cancel()
+                elif job.task.exception() is not None:
+                    job.future.set_exception(job.task.exception())
+                else:
+                    job.future.set_result(job.task.result())
+            finally:
+                self._queue.task_done()
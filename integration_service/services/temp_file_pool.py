@@ -0,0 +1,64 @@
+"""Pool of reusable scratch files for request uploads."""
+import os
+import shutil
+import tempfile
+from collections import deque
+from typing import Deque, Optional, Set
+
+
+class TempFilePool:
+    """Ring of pre-created scratch files reused across requests.
+
+    ``acquire`` hands out a free slot (or a one-off overflow file when every
+    slot is busy) and ``release`` truncates the slot and returns it to the
+    ring, so steady-state requests create and unlink no files.
+    """
+
+    def __init__(self, directory: str, size: int):
+        self.directory = directory
+        self.size = size
+        self._root: Optional[str] = None
+        self._slots: Set[str] = set()
+        self._free: Deque[str] = deque()
+
+    def open(self) -> None:
+        """Create the pool directory and its slot files."""
+        os.makedirs(self.directory, exist_ok=True)
+        self._root = tempfile.mkdtemp(prefix="upload-pool-", dir=self.directory)
+        for index in range(self.size):
+            path = os.path.join(self._root, f"slot-{index}")
+            open(path, "wb").close()
+            self._slots.add(path)
+            self._free.append(path)
+
+    def close(self) -> None:
+        """Remove the pool directory and every file in it."""
+        if self._root is not None:
+            shutil.rmtree(self._root, ignore_errors=True)
+        self._root = None
+        self._slots.clear()
+        self._free.clear()
+
+    def acquire(self) -> str:
+        """Return the path of an empty scratch file owned by the caller."""
+        if self._root is None:
+            raise RuntimeError("Temp file pool is not open")
+        try:
+            return self._free.popleft()
+        except IndexError:
+            fd, path = tempfile.mkstemp(prefix="overflow-", dir=self._root)
+            os.close(fd)
+            return path
+
+    def release(self, path: str) -> None:
+        """Give a scratch file back to the pool."""
+        if path not in self._slots:
+            if os.path.exists(path):
+                os.unlink(path)
+            return
+        try:
+            os.truncate(path, 0)
+        except OSError:
+            # Leave a broken slot out of the ring; overflow files cover for it
+            return
+        self._free.append(path)
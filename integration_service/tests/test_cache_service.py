@@ -0,0 +1,45 @@
+"""Tests for the result cache."""
+import pytest
+import asyncio
+from ..services.cache_service import CacheManager
+
+@pytest.mark.asyncio
+async def test_memory_cache_round_trip():
+    """Test get/set without Redis configured."""
+    cache = CacheManager()
+
+    assert await cache.get("missing") is None
+
+    await cache.set("key", {"job_id": "abc"})
+    assert await cache.get("key") == {"job_id": "abc"}
+
+@pytest.mark.asyncio
+async def test_memory_cache_evicts_least_recently_used():
+    """Test the in-memory cache stays within max_entries."""
+    cache = CacheManager(max_entries=2)
+
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+    await cache.set("c", 3)
+
+    assert await cache.get("a") == 1
+    assert await cache.get("b") is None
+    assert await cache.get("c") == 3
+
+@pytest.mark.asyncio
+async def test_unresponsive_redis_falls_back_to_memory():
+    """Test that a Redis server that never answers times out instead of hanging."""
+    async def never_answer(reader, writer):
+        await reader.read()
+
+    server = await asyncio.start_server(never_answer, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    cache = CacheManager(redis_url=f"redis://127.0.0.1:{port}/0", timeout=0.1)
+
+    try:
+        await asyncio.wait_for(cache.set("key", {"job_id": "abc"}), 2)
+        assert await asyncio.wait_for(cache.get("key"), 2) == {"job_id": "abc"}
+    finally:
+        await cache.aclose()
+        server.close()
@@ -1,19 +1,98 @@
 """Tests for Miner Service."""  
 import pytest  
-import asyncio  
-from services.miner_service import MinerService  
+import httpx
+import json
+import msgspec
+from ..services.miner_service import MinerService, MotifOutput  
   
-@pytest.mark.asyncio  
-async def test_validate_motif_output():  
+VALID_OUTPUT = (
+    b'{"results_path": "/shared/output/job/results", '
+    b'"plots_path": "/shared/output/job/plots", '
+    b'"status": "success", "motifs": []}'
+)
+
+def _service(tmp_path, responses):
+    """Build a MinerService whose client replays `responses` in order."""
+    requests = []
+
+    async def handler(request):
+        await request.aread()
+        requests.append(request)
+        return responses[len(requests) - 1]
+
+    service = MinerService()
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    graph_file = tmp_path / "networkx_graph.pkl"
+    graph_file.write_bytes(b"graph")
+    return service, str(graph_file), requests
+
+def test_motif_output_decoding():  
     """Test motif output validation."""  
-    miner_service = MinerService()  
+    result = msgspec.json.decode(VALID_OUTPUT, type=MotifOutput)
+    assert result.status == "success"
+    assert result.results_path == "/shared/output/job/results"
       
-    valid_output = {  
-        "motifs": [{"id": 1, "pattern": "..."}],  
-        "statistics": {"total_motifs": 5}  
-    }  
-      
-    assert miner_service.validate_motif_output(valid_output) == True  
-      
-    invalid_output = {"motifs": []}  
-    assert miner_service.validate_motif_output(invalid_output) == False
\ No newline at end of file
+    invalid_output = b'{"motifs": []}'
+    with pytest.raises(msgspec.ValidationError):
+        msgspec.json.decode(invalid_output, type=MotifOutput)
+
+@pytest.mark.asyncio
+async def test_mine_motifs_rejects_missing_fields(tmp_path):
+    """Test that a response without results_path raises ValueError."""
+    body = b'{"plots_path": "/shared/output/job/plots", "status": "success"}'
+    service, graph_file, _ = _service(tmp_path, [httpx.Response(200, content=body)])
+
+    try:
+        with pytest.raises(ValueError, match="Invalid motif output structure"):
+            await service.mine_motifs(graph_file, job_id="job")
+    finally:
+        await service.aclose()
+
+@pytest.mark.asyncio
+async def test_mine_motifs_retries_unavailable(tmp_path):
+    """Test that a 503 with Retry-After is retried and the full next response returned."""
+    service, graph_file, requests = _service(tmp_path, [
+        httpx.Response(503, headers={"Retry-After": "0"}),
+        httpx.Response(200, content=VALID_OUTPUT)
+    ])
+
+    try:
+        result = await service.mine_motifs(graph_file, job_id="job")
+    finally:
+        await service.aclose()
+
+    assert len(requests) == 2
+    assert result == json.loads(VALID_OUTPUT)
+
+@pytest.mark.asyncio
+async def test_mine_motifs_gives_up_after_retries(tmp_path):
+    """Test that a 503 on the last attempt raises RuntimeError."""
+    unavailable = httpx.Response(503, headers={"Retry-After": "0"})
+    service, graph_file, requests = _service(tmp_path, [unavailable] * 3)
+
+    try:
+        with pytest.raises(RuntimeError, match="503"):
+            await service.mine_motifs(graph_file, job_id="job", max_retries=3)
+    finally:
+        await service.aclose()
+
+    assert len(requests) == 3
+
+@pytest.mark.asyncio
+async def test_mine_motifs_shared_handoff_sends_path(tmp_path):
+    """Test that the shared-volume handoff posts JSON with the graph path and no upload."""
+    service, graph_file, requests = _service(tmp_path, [httpx.Response(200, content=VALID_OUTPUT)])
+    service.shared_handoff = True
+
+    try:
+        await service.mine_motifs(graph_file, job_id="job", mining_config={"n_trials": 5})
+    finally:
+        await service.aclose()
+
+    request = requests[0]
+    body = json.loads(request.content)
+    assert request.headers["Content-Type"] == "application/json"
+    assert body["networkx_path"] == graph_file
+    assert body["job_id"] == "job"
+    assert body["n_trials"] == 5
+    assert b"Content-Disposition" not in request.content
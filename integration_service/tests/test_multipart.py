@@ -0,0 +1,84 @@
+"""Tests for the streaming multipart encoder."""
+import pytest
+from starlette.datastructures import Headers
+from starlette.formparsers import MultiPartParser
+from ..services.multipart import MultipartFileStream
+
+async def _collect(body):
+    return b"".join([chunk async for chunk in body])
+
+def _write(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+@pytest.mark.asyncio
+async def test_content_length_matches_body(tmp_path):
+    """Test that the advertised Content-Length is the exact body size."""
+    nodes = _write(tmp_path, "nodes.csv", b"id,name\n" * 200000)
+    edges = _write(tmp_path, "edges.csv", b"")
+    body = MultipartFileStream(
+        {"config": "{}", "tenant_id": "default"},
+        [
+            ("files", "nodes.csv", nodes, "text/csv"),
+            ("files", "edges.csv", edges, "text/csv")
+        ]
+    )
+
+    content = await _collect(body)
+
+    assert body.content_length() == len(content)
+    assert body.headers["Content-Length"] == str(len(content))
+
+@pytest.mark.asyncio
+async def test_round_trip_through_starlette_parser(tmp_path):
+    """Test that fields and files survive a parse by Starlette's multipart parser."""
+    nodes = _write(tmp_path, "slot-0", b"id,name\n1,NodeA\n")
+    edges = _write(tmp_path, "slot-1", b"src,dst\n1,2\n")
+    body = MultipartFileStream(
+        {"config": '{"name": "test"}', "writer_type": "networkx"},
+        [
+            ("files", "nodes.csv", nodes, "text/csv"),
+            ("files", "edges.csv", edges, "text/csv")
+        ]
+    )
+
+    async def stream():
+        async for chunk in body:
+            yield chunk
+
+    form = await MultiPartParser(Headers(body.headers), stream()).parse()
+    files = form.getlist("files")
+
+    assert form["config"] == '{"name": "test"}'
+    assert form["writer_type"] == "networkx"
+    assert [f.filename for f in files] == ["nodes.csv", "edges.csv"]
+    assert await files[0].read() == b"id,name\n1,NodeA\n"
+    assert await files[1].read() == b"src,dst\n1,2\n"
+    assert files[0].content_type == "text/csv"
+
+@pytest.mark.asyncio
+async def test_filename_is_quoted(tmp_path):
+    """Test that quotes and newlines cannot break out of the filename parameter."""
+    path = _write(tmp_path, "slot-0", b"x")
+    body = MultipartFileStream({}, [("files", 'a"b\r\nc.csv', path, "text/csv")])
+
+    content = await _collect(body)
+
+    assert b'filename="a%22b%0D%0Ac.csv"' in content
+
+@pytest.mark.asyncio
+async def test_form_values_match_httpx_encoding():
+    """Test that booleans and None are encoded like httpx's data= argument."""
+    body = MultipartFileStream({"on": True, "off": False, "empty": None, "size": 5}, [])
+
+    async def stream():
+        async for chunk in body:
+            yield chunk
+
+    form = await MultiPartParser(Headers(body.headers), stream()).parse()
+
+    assert form["on"] == "true"
+    assert form["off"] == "false"
+    assert form["empty"] == ""
+    assert form["size"] == "5"
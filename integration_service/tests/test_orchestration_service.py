@@ -1,6 +1,8 @@
 """Tests for orchestration service."""  
 import pytest  
 import asyncio  
+import io
+import zipfile
 from unittest.mock import AsyncMock, patch  
 from ..services.orchestration_service import OrchestrationService  
   
@@ -46,4 +48,33 @@ async def test_execute_mining_pipeline():
                 assert len(result["motifs"]) == 1  
       
     finally:  
-        os.unlink(csv_path)
\ No newline at end of file
+        os.unlink(csv_path)
+
+def test_create_job_archive_stream(tmp_path):
+    """Test that the streamed archive is a valid zip of the whole job directory."""
+    service = OrchestrationService()
+    service.local_output_dir = str(tmp_path)
+    job_dir = tmp_path / "job-1"
+    (job_dir / "plots" / "instances").mkdir(parents=True)
+    (job_dir / "results.json").write_text('{"motifs": []}')
+    (job_dir / "plots" / "pattern.png").write_bytes(b"\x89PNG" * 1000)
+    (job_dir / "plots" / "instances" / "instance.html").write_text("<html></html>")
+
+    content = b"".join(service.create_job_archive_stream("job-1"))
+
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.testzip() is None
+        assert archive.namelist() == [
+            "results.json",
+            "plots/pattern.png",
+            "plots/instances/instance.html"
+        ]
+        assert archive.read("plots/pattern.png") == b"\x89PNG" * 1000
+
+def test_create_job_archive_stream_missing_job(tmp_path):
+    """Test that a missing job directory raises before streaming starts."""
+    service = OrchestrationService()
+    service.local_output_dir = str(tmp_path)
+
+    with pytest.raises(FileNotFoundError):
+        service.create_job_archive_stream("missing-job")
@@ -0,0 +1,172 @@
+"""Tests for the pipeline API handlers."""
+import io
+import json
+import os
+import pytest
+import pytest_asyncio
+from starlette.datastructures import UploadFile
+from ..api import pipeline
+from ..services.cache_service import CacheManager
+from ..services.pipeline_queue import PipelineQueue
+from ..services.temp_file_pool import TempFilePool
+
+MINING_DEFAULTS = {
+    "min_pattern_size": 3,
+    "max_pattern_size": 5,
+    "min_neighborhood_size": 3,
+    "max_neighborhood_size": 5,
+    "n_neighborhoods": 500,
+    "n_trials": 100,
+    "graph_type": "directed",
+    "search_strategy": "greedy",
+    "sample_method": "tree",
+    "graph_output_format": "representative"
+}
+
+@pytest_asyncio.fixture
+async def api(tmp_path, monkeypatch):
+    """Point the pipeline module at fresh queues, cache, upload pool and output dir."""
+    pool = TempFilePool(str(tmp_path / "uploads"), 2)
+    graph_queue = PipelineQueue(concurrency=1, max_size=10)
+    mining_queue = PipelineQueue(concurrency=1, max_size=10)
+    monkeypatch.setattr(pipeline, "upload_pool", pool)
+    monkeypatch.setattr(pipeline, "graph_queue", graph_queue)
+    monkeypatch.setattr(pipeline, "mining_queue", mining_queue)
+    monkeypatch.setattr(pipeline, "result_cache", CacheManager())
+    monkeypatch.setattr(
+        pipeline.orchestration_service, "local_output_dir", str(tmp_path / "output")
+    )
+    pool.open()
+    graph_queue.start()
+    mining_queue.start()
+    yield pipeline
+    await graph_queue.stop()
+    await mining_queue.stop()
+    pool.close()
+
+@pytest.fixture
+def fake_graphs(monkeypatch):
+    """Replace AtomSpace graph generation with one that returns a new job each call."""
+    jobs = []
+
+    async def generate_networkx(csv_files, filenames, **kwargs):
+        jobs.append([open(path, "rb").read() for path in csv_files])
+        job_id = f"job-{len(jobs)}"
+        return {
+            "job_id": job_id,
+            "status": "success",
+            "networkx_file": f"/shared/output/{job_id}/networkx_graph.pkl"
+        }
+
+    monkeypatch.setattr(pipeline.orchestration_service, "generate_networkx", generate_networkx)
+    return jobs
+
+@pytest.fixture
+def fake_miner(monkeypatch):
+    """Replace mining with one that writes the config it was given as the job's results."""
+    service = pipeline.orchestration_service
+    mined = []
+
+    async def mine_patterns(job_id, mining_config, result_key=None):
+        mined.append(job_id)
+        results = f"{service.local_output_dir}/{job_id}/results"
+        os.makedirs(results, exist_ok=True)
+        with open(f"{results}/motifs.json", "w") as f:
+            json.dump(mining_config, f)
+        service._write_result_key(job_id, result_key)
+        return service._mining_result(job_id, service._local_paths(job_id))
+
+    monkeypatch.setattr(service, "mine_patterns", mine_patterns)
+    return mined
+
+def _csv(name, content=b"id,name\n1,NodeA\n"):
+    return UploadFile(io.BytesIO(content), filename=name)
+
+async def _generate(api, files):
+    return await api.generate_graph(
+        files=files,
+        config="{}",
+        schema_json="{}",
+        writer_type="networkx",
+        graph_type="directed"
+    )
+
+async def _mine(api, job_id, **overrides):
+    return await api.mine_patterns(job_id=job_id, **{**MINING_DEFAULTS, **overrides})
+
+def _results(api, job_id):
+    path = f"{api.orchestration_service.local_output_dir}/{job_id}/results/motifs.json"
+    with open(path) as f:
+        return json.load(f)
+
+@pytest.mark.asyncio
+async def test_generate_graph_never_shares_jobs(api, fake_graphs):
+    """Test that identical uploads still get their own AtomSpace job."""
+    first = await _generate(api, [_csv("nodes.csv")])
+    second = await _generate(api, [_csv("nodes.csv")])
+
+    assert first["job_id"] == "job-1"
+    assert second["job_id"] == "job-2"
+    assert fake_graphs == [[b"id,name\n1,NodeA\n"], [b"id,name\n1,NodeA\n"]]
+    assert len(api.upload_pool._free) == 2
+
+@pytest.mark.asyncio
+async def test_generate_graph_releases_uploads_when_a_save_fails(api, fake_graphs):
+    """Test that uploads saved alongside a failed one go back to the pool."""
+    class BrokenUpload:
+        filename = "broken.csv"
+
+        async def read(self, size):
+            raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        await _generate(api, [_csv("nodes.csv"), BrokenUpload(), _csv("edges.csv")])
+
+    assert fake_graphs == []
+    assert len(api.upload_pool._free) == 2
+    assert sorted(os.listdir(api.upload_pool._root)) == ["slot-0", "slot-1"]
+
+@pytest.mark.asyncio
+async def test_mine_patterns_reuses_results_for_identical_graphs(api, fake_graphs, fake_miner):
+    """Test that mining results are shared by content and config, never by job directory."""
+    await _generate(api, [_csv("nodes.csv")])
+    await _generate(api, [_csv("nodes.csv")])
+
+    first = await _mine(api, "job-1")
+    repeat = await _mine(api, "job-1")
+    copied = await _mine(api, "job-2")
+
+    assert fake_miner == ["job-1"]
+    assert repeat == first
+    assert copied["job_id"] == "job-2"
+    assert copied["download_url"].endswith("job_id=job-2")
+    assert _results(api, "job-2") == _results(api, "job-1")
+
+    # Re-mining job-1 with another config must not change job-2's copy
+    await _mine(api, "job-1", n_trials=5)
+
+    assert fake_miner == ["job-1", "job-1"]
+    assert _results(api, "job-1")["n_trials"] == 5
+    assert _results(api, "job-2")["n_trials"] == 100
+
+@pytest.mark.asyncio
+async def test_mine_patterns_skips_overwritten_source(api, fake_graphs, fake_miner):
+    """Test that a cached result is not reused once its job was re-mined with another config."""
+    for _ in range(2):
+        await _generate(api, [_csv("nodes.csv")])
+
+    await _mine(api, "job-1")
+    await _mine(api, "job-1", n_trials=5)
+    result = await _mine(api, "job-2")
+
+    assert fake_miner == ["job-1", "job-1", "job-2"]
+    assert result["job_id"] == "job-2"
+    assert _results(api, "job-2")["n_trials"] == 100
+
+@pytest.mark.asyncio
+async def test_mine_patterns_without_source_always_mines(api, fake_miner):
+    """Test that jobs with no recorded source CSVs are mined every time."""
+    await _mine(api, "external-job")
+    await _mine(api, "external-job")
+
+    assert fake_miner == ["external-job", "external-job"]
@@ -0,0 +1,127 @@
+"""Tests for the pipeline worker queue."""
+import pytest
+import asyncio
+from ..services.pipeline_queue import PipelineQueue, QueueFullError
+
+@pytest.mark.asyncio
+async def test_submit_limits_concurrency():
+    """Test that no more than `concurrency` jobs run at once."""
+    queue = PipelineQueue(concurrency=2, max_size=10)
+    queue.start()
+    running = 0
+    peak = 0
+
+    async def job(value):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return value * 2
+
+    try:
+        results = await asyncio.gather(*[queue.submit(job, i) for i in range(6)])
+    finally:
+        await queue.stop()
+
+    assert results == [0, 2, 4, 6, 8, 10]
+    assert peak == 2
+
+@pytest.mark.asyncio
+async def test_submit_rejects_when_full():
+    """Test that a full queue raises instead of growing without bound."""
+    queue = PipelineQueue(concurrency=1, max_size=1)
+    queue.start()
+    release = asyncio.Event()
+
+    async def job():
+        await release.wait()
+
+    try:
+        first = asyncio.create_task(queue.submit(job))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(queue.submit(job))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(QueueFullError):
+            await queue.submit(job)
+
+        release.set()
+        await asyncio.gather(first, second)
+    finally:
+        await queue.stop()
+
+@pytest.mark.asyncio
+async def test_submit_propagates_errors():
+    """Test that a failing job raises in the caller."""
+    queue = PipelineQueue(concurrency=1, max_size=1)
+    queue.start()
+
+    async def job():
+        raise ValueError("boom")
+
+    try:
+        with pytest.raises(ValueError):
+            await queue.submit(job)
+    finally:
+        await queue.stop()
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_cancels_running_job():
+    """Test that cancelling the caller stops its job before the caller returns."""
+    queue = PipelineQueue(concurrency=1, max_size=1)
+    queue.start()
+    started = asyncio.Event()
+    stopped = False
+
+    async def job():
+        nonlocal stopped
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        finally:
+            stopped = True
+
+    try:
+        caller = asyncio.create_task(queue.submit(job))
+        await started.wait()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert stopped
+
+        async def next_job():
+            return "ok"
+
+        assert await queue.submit(next_job) == "ok"
+    finally:
+        await queue.stop()
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_skips_queued_job():
+    """Test that a job whose caller left while it was queued never runs."""
+    queue = PipelineQueue(concurrency=1, max_size=1)
+    queue.start()
+    release = asyncio.Event()
+    ran = False
+
+    async def blocker():
+        await release.wait()
+
+    async def job():
+        nonlocal ran
+        ran = True
+
+    try:
+        first = asyncio.create_task(queue.submit(blocker))
+        await asyncio.sleep(0.01)
+        second = asyncio.create_task(queue.submit(job))
+        await asyncio.sleep(0.01)
+        second.cancel()
+        release.set()
+        await first
+        await asyncio.sleep(0.01)
+    finally:
+        await queue.stop()
+
+    assert not ran
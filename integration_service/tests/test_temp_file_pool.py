@@ -0,0 +1,40 @@
+"""Tests for the upload scratch file pool."""
+import os
+import pytest
+from ..services.temp_file_pool import TempFilePool
+
+def test_release_recycles_slot(tmp_path):
+    """Test that released slots are truncated and handed out again."""
+    pool = TempFilePool(str(tmp_path), size=1)
+    pool.open()
+    try:
+        path = pool.acquire()
+        with open(path, "wb") as f:
+            f.write(b"id,name\n")
+        pool.release(path)
+
+        assert pool.acquire() == path
+        assert os.path.getsize(path) == 0
+    finally:
+        pool.close()
+
+def test_overflow_files_are_removed(tmp_path):
+    """Test that an exhausted pool falls back to one-off files."""
+    pool = TempFilePool(str(tmp_path), size=1)
+    pool.open()
+    try:
+        slot = pool.acquire()
+        overflow = pool.acquire()
+
+        assert overflow != slot
+        pool.release(overflow)
+        assert not os.path.exists(overflow)
+    finally:
+        pool.close()
+
+def test_acquire_requires_open_pool(tmp_path):
+    """Test that a closed pool refuses to hand out files."""
+    pool = TempFilePool(str(tmp_path), size=1)
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()